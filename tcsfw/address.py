@@ -236,6 +236,7 @@ class IPAddress(AnyAddress):
     """IP address, either IPv4 or IPv6"""
     def __init__(self, data: Union[IPv4Address, IPv6Address]):
         self.data = data
+        self.address_hash = hash(data)  # addresses are used as keys a lot, hash once
 
     def get_ip_address(self) -> Optional['IPAddress']:
         return self
@@ -267,12 +268,14 @@ class IPAddress(AnyAddress):
         return f"{self.data}"  # IP is the default
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, IPAddress):
             return False
         return self.data == other.data
 
     def __hash__(self):
-        return self.data.__hash__()
+        return self.address_hash
 
     def __repr__(self):
         return str(self.data)
@@ -288,6 +291,8 @@ class IPAddresses:
 
 class DNSName(AnyAddress):
     """DNS name"""
+    NUMERIC_CHARACTERS = frozenset("0123456789.:")  # characters of IP address -looking names
+
     def __init__(self, name: str):
         self.name = name
 
@@ -304,12 +309,14 @@ class DNSName(AnyAddress):
         return f"{self.name}|name"
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, DNSName):
             return False
         return self.name == other.name
 
     def __hash__(self):
-        return self.name.__hash__()
+        return hash(self.name)
 
     def __repr__(self):
         return self.name
@@ -327,10 +334,8 @@ class DNSName(AnyAddress):
         """Does the given name look like DNS domain name?"""
         if '.' not in name:
             return False
-        for c in name:
-            if c != '.' and c != ':' and not ('0' <= c <= '9'):  # pylint: disable=superfluous-parens
-                return True  # nost just numbers, good enough for this check
-        return False  # only numbers and dots
+        # not just numbers, good enough for this check
+        return not cls.NUMERIC_CHARACTERS.issuperset(name)
 
 
 class EndpointAddress(AnyAddress):
@@ -339,6 +344,7 @@ class EndpointAddress(AnyAddress):
         self.host = host
         self.protocol = protocol
         self.port = port
+        self.address_hash = hash(host) ^ hash(protocol) ^ port  # addresses are used as keys a lot, hash once
 
     @classmethod
     def any(cls, protocol: Protocol, port: int) -> 'EndpointAddress':
@@ -391,12 +397,15 @@ class EndpointAddress(AnyAddress):
         return f"{self.host.get_parseable_value()}{prot}{port}"
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, EndpointAddress):
             return False
-        return self.host == other.host and self.protocol == other.protocol and self.port == other.port
+        return self.address_hash == other.address_hash and self.host == other.host \
+            and self.protocol == other.protocol and self.port == other.port
 
     def __hash__(self):
-        return self.host.__hash__() ^ self.protocol.__hash__() ^ self.port
+        return self.address_hash
 
     @classmethod
     def protocol_port_string(cls, value: Optional[Tuple[Protocol, int]]) -> str:
@@ -35,3 +35,8 @@ class Status(enum.Enum):
     EXPECTED = "Expected"          # Expected entity
     UNEXPECTED = "Unexpected"      # Unexpected entity
     EXTERNAL = "External"          # External entity
+
+
+# Status sets for membership checks, to avoid building sets in tight loops
+STATUS_RELEVANT = frozenset({Status.EXPECTED, Status.UNEXPECTED})
+STATUS_NO_PROPERTIES = frozenset({Status.PLACEHOLDER, Status.UNEXPECTED})
@@ -16,7 +16,7 @@ from tcsfw.basics import ConnectionType, ExternalActivity, HostType, Status
 from tcsfw.batch_import import BatchImporter, LabelFilter
 from tcsfw.claim_coverage import RequirementClaimMapper
 from tcsfw.client_api import APIRequest, ClientPrompt
-from tcsfw.components import CookieData, Cookies, DataReference, DataStorages, Software
+from tcsfw.components import CookieData, Cookies, DataStorages, Software
 from tcsfw.coverage_result import CoverageReport
 from tcsfw.entity import ClaimAuthority, Entity
 from tcsfw.event_interface import PropertyEvent
@@ -55,6 +55,11 @@ class SystemBackend(SystemBuilder):
         self.visualizer = Visualizer()
         self.loaders: List[EvidenceLoader] = []
         self.protocols: Dict[Any, 'ProtocolBackend'] = {}
+        self.connections_by_ends: Dict[Tuple[Addressable, Addressable], Connection] = {}
+        # connections by host pair, both directions. Only covers connections declared by the builder,
+        # not the ones created when matching traffic, so do not use after matching starts
+        self.connections_by_hosts: Dict[Tuple[Host, Host], List[Connection]] = {}
+        self.arp_broadcast: Optional['ServiceBackend'] = None  # ARP service at broadcast node, when created
         self.address_resolver = AddressResolver()
 
     def network(self, mask: str) -> Self:
@@ -162,15 +167,22 @@ class SystemBackend(SystemBuilder):
                 p = protocol()
             assert isinstance(
                 p, ProtocolConfigurer), f"Not protocol type: {p.__class__.__name__}"
-            be = self.protocols[p] = ProtocolBackend.new(p)
+            # configurers with equal values share a backend, values taken when first used
+            values = p.get_values()
+            be = self.protocols.get(values)
+            if be is None:
+                be = self.protocols[values] = ProtocolBackend.new(p)
+            self.protocols[protocol] = be  # configurer or its class, same backend for it later
         return be
 
     def _free_host_name(self, name_base: str) -> str:
         n = self.system.free_child_name(name_base)
         if n != name_base:
-            # dirty hack, check all names match keys
-            self.hosts_by_name = {
-                h.entity.name: h for h in self.hosts_by_name.values()}
+            # host with the name base may have been renamed, update its key
+            hb = self.hosts_by_name.get(name_base)
+            if hb is not None and hb.entity.name != name_base:
+                del self.hosts_by_name[name_base]
+                self.hosts_by_name[hb.entity.name] = hb
         return n
 
     def finish_(self):
@@ -178,20 +190,8 @@ class SystemBackend(SystemBuilder):
         # get the missing addresses
         self.address_resolver.require()
 
-        # We want to have a authenticator related to each authenticated service
-        # NOTE: Not ready to go into this level now...
-        # auth_map = DataUsage.map_authenticators(self.system, {})
-        # for hb in self.hosts_by_name.values():
-        #     for sb in hb.service_builders.values():
-        #         s = sb.entity
-        #         if s not in auth_map and s.authentication:
-        #             auth = PieceOfData(f"Auth-{s.name}")  # default authenticator
-        #             auth.authenticator_for.append(s)
-        #             hb.use_data(DataPieceBuilder(self, [auth]))
-        #             # property to link from service to authentication
-        #             exp = f"Authentication by {auth.name} (implicit)"
-        #             prop_v = Properties.AUTHENTICATION_DATA.value(explanation=exp)
-        #             prop_v[0].set(s.properties, prop_v[1])
+        # NOTE: We want to have a authenticator related to each authenticated service,
+        # but not ready to go into this level now...
 
 
 class NodeBackend(NodeBuilder, NodeManipulator):
@@ -213,9 +213,10 @@ class NodeBackend(NodeBuilder, NodeManipulator):
 
     def dns(self, name: str) -> Self:
         dn = DNSName(name)
-        if dn in self.system.entity_by_address:
+        by_address = self.system.entity_by_address
+        if dn in by_address:
             raise ConfigurationException(f"Using name many times: {dn}")
-        self.system.entity_by_address[dn] = self
+        by_address[dn] = self
         self.entity.addresses.add(dn)
         return self
 
@@ -258,12 +259,13 @@ class NodeBackend(NodeBuilder, NodeManipulator):
 
     def new_address_(self, address: AnyAddress) -> AnyAddress:
         """Add new address to the entity"""
-        old = self.system.entity_by_address.get(address)
-        if old:
+        by_address = self.system.entity_by_address
+        old = by_address.get(address)
+        if old is not None:
             raise ConfigurationException(
                 f"Duplicate address {address}, reserved by: {old.entity.name}")
+        by_address[address] = self
         self.entity.addresses.add(address)
-        self.system.entity_by_address[address] = self
         return address
 
     def new_service_(self, name: str, port=-1):
@@ -312,17 +314,24 @@ class ServiceBackend(NodeBackend, ServiceBuilder):
         if self.source_fixer:
             assert isinstance(s, HostBackend)
             s = self.source_fixer(s)
-        for c in s.entity.get_parent_host().connections:
-            if c.source == s.entity and c.target == self.entity:
-                # referring existing connection
-                return ConnectionBackend(c, (s, self))
+        ends = s.entity, self.entity
+        c = self.system.connections_by_ends.get(ends)
+        if c is not None:
+            # referring existing connection
+            return ConnectionBackend(c, (s, self))
         c = Connection(s.entity, self.entity)
         c.status = Status.EXPECTED
         c.con_type = self.entity.con_type
         for e in [s.entity, self.entity]:
             e.status = Status.EXPECTED
-        s.entity.get_parent_host().connections.append(c)
-        self.entity.get_parent_host().connections.append(c)
+        source_host, target_host = s.entity.get_parent_host(), self.entity.get_parent_host()
+        by_hosts = self.system.connections_by_hosts
+        source_host.connections.append(c)
+        by_hosts.setdefault((source_host, target_host), []).append(c)
+        if target_host is not source_host:
+            target_host.connections.append(c)
+            by_hosts.setdefault((target_host, source_host), []).append(c)
+        self.system.connections_by_ends[ends] = c
         return ConnectionBackend(c, (s, self))
 
 
@@ -362,7 +371,7 @@ class HostBackend(NodeBackend, HostBuilder):
         entity.status = Status.EXPECTED
         system.hosts_by_name[entity.name] = self
         if DNSName.looks_like(entity.name):
-            self.name(entity.name)
+            self.dns(entity.name)  # name is already set
         self.service_builders: Dict[Tuple[Protocol, int], ServiceBackend] = {}
 
     def hw(self, address: str) -> 'HostBackend':
@@ -391,9 +400,7 @@ class HostBackend(NodeBackend, HostBuilder):
 
     def use_data(self, *data: 'SensitiveDataBackend') -> Self:
         usage = DataStorages.get_storages(self.entity, add=True)
-        for db in data:
-            for d in db.data:
-                usage.sub_components.append(DataReference(usage, d))
+        usage.add_data(d for db in data for d in db.data)
         return self
 
     def __truediv__(self, protocol: ProtocolType) -> ServiceBackend:
@@ -419,8 +426,7 @@ class SensitiveDataBackend(SensitiveDataBuilder):
         self.data = data
         # all sensitive data lives at least in system
         usage = DataStorages.get_storages(parent.system, add=True)
-        for d in data:
-            usage.sub_components.append(DataReference(usage, d))
+        usage.add_data(data)
 
     def used_by(self, *host: HostBackend) -> Self:
         for h in host:
@@ -457,12 +463,8 @@ class SoftwareBackend(SoftwareBuilder):
     def updates_from(self, source: Union[ConnectionBackend, ServiceBackend, HostBackend]) -> Self:
         host = self.parent.entity
 
-        cs = []
         if isinstance(source, HostBackend):
-            end = source.entity
-            for c in host.get_connections():
-                if c.source.get_parent_host() == end or c.target.get_parent_host() == end:
-                    cs.append(c)
+            cs = self.parent.system.connections_by_hosts.get((host, source.entity), [])
         else:
             raise ConfigurationException(
                 "Only support updates_by host implemented")
@@ -579,12 +581,12 @@ class ProtocolBackend:
 
     def get_service_(self, parent: HostBackend) -> ServiceBackend:
         """Create or get service builder"""
-        old = parent.service_builders.get(
-            (self.transport, self.service_port if self.port_to_name else -1))
+        key = self.transport, self.service_port
+        old = parent.service_builders.get(key)
         if old:
             return old
         b = self._create_service(parent)
-        parent.service_builders[(self.transport, self.service_port)] = b
+        parent.service_builders[key] = b
         b.entity.status = Status.EXPECTED
         assert b.entity.parent == parent.entity
         parent.entity.children.append(b.entity)
@@ -630,7 +632,16 @@ class ARPBackend(ProtocolBackend):
             return super().get_service_(parent)
         host_s = super().get_service_(parent)
         # ARP can be broadcast, get or create the broadcast host and service
-        bc_node = parent.system.get_host_(
+        bc_s = parent.system.arp_broadcast
+        if bc_s is None:
+            bc_s = parent.system.arp_broadcast = self._get_broadcast_service(parent.system, host_s)
+        if (host_s.entity, bc_s.entity) not in parent.system.connections_by_ends:
+            host_s >> bc_s  # # pylint: disable=pointless-statement
+        return bc_s  # NOTE: the broadcast
+
+    def _get_broadcast_service(self, system: SystemBackend, host_s: ServiceBackend) -> ServiceBackend:
+        """Get or create the broadcast node ARP service"""
+        bc_node = system.get_host_(
             f"{HWAddresses.BROADCAST}", description="Broadcast")
         bc_s = bc_node.service_builders.get(
             (self.transport, self.service_port))
@@ -651,10 +662,7 @@ class ARPBackend(ProtocolBackend):
             bc_s.entity.con_type = ConnectionType.ADMINISTRATIVE
             bc_s.entity.external_activity = bc_node.entity.external_activity
             host_s.entity.external_activity = self.external_activity
-        c_ok = any(c.source == host_s.entity for c in host_s.entity.get_parent_host().connections)
-        if not c_ok:
-            host_s >> bc_s  # # pylint: disable=pointless-statement
-        return bc_s  # NOTE: the broadcast
+        return bc_s
 
 
 class DHCPBackend(ProtocolBackend):
@@ -672,7 +680,6 @@ class DHCPBackend(ProtocolBackend):
         def create_source(host: HostBackend):
             # DHCP client uses specific port 68 for requests
             src = UDP(port=68, name="DHCP")
-            src.port_to_name = False
             cs = host / src
             cs.entity.host_type = HostType.ADMINISTRATIVE
             cs.entity.con_type = ConnectionType.ADMINISTRATIVE
@@ -855,14 +862,15 @@ class ClaimBackend(ClaimBuilder):
                  authority=ClaimAuthority.MODEL):
         self.builder = builder
         self.authority = authority
-        self.source = builder.sources.get(label)
-        if self.source is None:
-            self.source = EvidenceSource(f"Claims '{label}'", label=label)
-            self.source.model_override = True  # sent by model, override from DB
-            builder.sources[label] = self.source
+        source = builder.sources.get(label)
+        if source is None:
+            source = builder.sources[label] = EvidenceSource(f"Claims '{label}'", label=label)
+            source.model_override = True  # sent by model, override from DB
+        self.source = source
         self.explanation = explanation
         self.property_keys: List[PropertyKey] = []
         self.locations: List[Entity] = []
+        self.software_locations: List[NodeBackend] = []  # software resolved when the model is complete
         self.verdict = verdict
         builder.claim_builders.append(self)
 
@@ -902,9 +910,7 @@ class ClaimBackend(ClaimBuilder):
         return self
 
     def software(self, *locations: NodeBackend) -> 'Self':
-        for lo in locations:
-            for sw in Software.list_software(lo.entity):
-                self.locations.append(sw)
+        self.software_locations.extend(locations)
         return self
 
     def vulnerabilities(self, *entry: Tuple[str, str]) -> Self:
@@ -917,8 +923,9 @@ class ClaimBackend(ClaimBuilder):
     def finish_loaders(self) -> SubLoader:
         """Finish by returning the loader to use"""
         this = self
-        locations = self.locations
-        keys = self.property_keys
+        locations = self.locations + [sw for lo in self.software_locations for sw in Software.list_software(lo.entity)]
+        # claim is complete, the property values are the same for every load
+        kvs = [key.verdict(self.verdict, explanation=self.explanation) for key in self.property_keys]
 
         class ClaimLoader(SubLoader):
             """Loader for the claims here"""
@@ -932,12 +939,10 @@ class ClaimBackend(ClaimBuilder):
                 if not label_filter.filter(self.source_label):
                     return
                 evidence = Evidence(this.source)
+                update = registry.property_update
                 for loc in locations:
-                    for key in keys:
-                        kv = PropertyKey.create(key.segments).verdict(
-                            this.verdict, explanation=this.explanation)
-                        ev = PropertyEvent(evidence, loc, kv)
-                        registry.property_update(ev)
+                    for kv in kvs:
+                        update(PropertyEvent(evidence, loc, kv))
         return ClaimLoader()
 
 
@@ -979,10 +984,7 @@ class ClaimSetBackend(ClaimSetBuilder):
 
     def finish_loaders(self) -> List[SubLoader]:
         """Finish"""
-        ls = []
-        ls.extend([cb.finish_loaders() for cb in self.claim_builders])
-        ls.extend(self.tool_plans)
-        return ls
+        return [cb.finish_loaders() for cb in self.claim_builders] + self.tool_plans
 
 
 class SystemBackendRunner(SystemBackend):
@@ -109,12 +109,14 @@ class ClientAPI(ModelListener):
         self.registry = registry
         self.claim_coverage = RequirementClaimMapper(self.registry.system) if claims is None else claims
         self.logger = logging.getLogger("api")
-        self.api_listener: List[Tuple[APIListener, APIRequest]] = []
+        self.api_listener: Dict[APIListener, APIRequest] = {}
         registry.system.model_listeners.append(self)
         # API aggregates verdicts from children into parents, keep track
         self.verdict_cache: Dict[Entity, Verdict] = {}
         # local IDs strings for entities and connections
         self.ids: Dict[Any, str] = {}
+        # incremented on model changes, allows to cache model dumps
+        self.model_version = 0
 
     def api_get(self, request: APIRequest) -> Dict:
         """Get API data"""
@@ -175,9 +177,10 @@ class ClientAPI(ModelListener):
         importer = BatchImporter(self.registry)
         importer.import_batch(data_file)
         if old_evidence != self.registry.all_evidence:
+            self.model_version += 1
             # batch import can bring new evdence sources, send evidence change event
             change_event = {"evidence": self.get_evidence_filter()}
-            for ln, _ in self.api_listener:
+            for ln in self.api_listener:
                 ln.note_evidence_change(change_event)
         return {}
 
@@ -191,8 +194,9 @@ class ClientAPI(ModelListener):
                 e_filter[ev] = sel
         self.registry.reset(e_filter, include_all)
         self.verdict_cache.clear()
+        self.model_version += 1
         # API reset event
-        for ln, req in self.api_listener:
+        for ln, req in self.api_listener.items():
             context = RequestContext(req, self)
             d = self.get_system_info(context)
             ln.note_system_reset({"system": d}, self.registry.system)
@@ -437,9 +441,10 @@ class ClientAPI(ModelListener):
         return f"{p}-{int_id}"
 
     def connection_change(self, connection: Connection):
+        self.model_version += 1
         if not connection.is_relevant(ignore_ends=True):
             return
-        for ln, req in self.api_listener:
+        for ln, req in self.api_listener.items():
             context = RequestContext(req, self)
             d = self.get_connection(connection, context)
             ln.note_connection_change({"connection": d}, connection)
@@ -448,22 +453,27 @@ class ClientAPI(ModelListener):
         self._find_verdict_changes(connection.target)
 
     def host_change(self, host: Host):
-        for ln, req in self.api_listener:
+        self.model_version += 1
+        for ln, req in self.api_listener.items():
             context = RequestContext(req.change_path("."), self)
             _, d = self.get_entity(host, context)
             ln.note_host_change({"host": d}, host)
 
     def address_change(self, host: Host):
+        self.model_version += 1
+        if not self.api_listener:
+            return  # no one to build the update for
         d = {
             "host_id": self.get_id(host),
             "host_name": host.long_name(),  # to help reading JSON events
             "addresses": sorted([f"{a}" for a in host.addresses])
         }
-        for ln, _ in self.api_listener:
+        for ln in self.api_listener:
             ln.note_address_change({"address": d}, host)
 
     def service_change(self, service: Service):
-        for ln, req in self.api_listener:
+        self.model_version += 1
+        for ln, req in self.api_listener.items():
             context = RequestContext(req.change_path("."), self)
             _, d = self.get_entity(service, context)
             ln.note_host_change({"service": d}, service)
@@ -471,25 +481,26 @@ class ClientAPI(ModelListener):
         self._find_verdict_changes(service.get_parent_host())
 
     def property_change(self, entity: Entity, value: Tuple[PropertyKey, Any]):
-        props = self.get_properties({value[0]: value[1]})
-        d = {
-            "id": self.get_id(entity),
-            "ent_name": entity.long_name(),  # to help reading JSON events
-        }
-        # check if status change
+        self.model_version += 1
+        # check if status change, verdict cache is kept up to date even without listeners
         old_v = self.verdict_cache.pop(entity, None)
-        if old_v is not None:
-            new_v = entity.get_verdict(self.verdict_cache)
+        new_v = None if old_v is None else entity.get_verdict(self.verdict_cache)
+        if new_v != old_v and isinstance(entity, Service):
+            # check if parent verdict changed, too
+            self._find_verdict_changes(entity.get_parent_host())
+        if self.api_listener:
+            d = {
+                "id": self.get_id(entity),
+                "ent_name": entity.long_name(),  # to help reading JSON events
+            }
             if new_v != old_v:
                 d["status"] = self.get_status_verdict(entity.status, new_v)
-                if isinstance(entity, Service):
-                    # check if parent verdict changed, too
-                    self._find_verdict_changes(entity.get_parent_host())
-        if props:
-            d["properties"] = props
-        js = {"update": d}
-        for ln, _ in self.api_listener:
-            ln.note_property_change(js, entity)
+            props = self.get_properties({value[0]: value[1]})
+            if props:
+                d["properties"] = props
+            js = {"update": d}
+            for ln in self.api_listener:
+                ln.note_property_change(js, entity)
         self._find_verdict_changes(entity)
 
     def _find_verdict_changes(self, entity: Entity):
@@ -498,13 +509,14 @@ class ClientAPI(ModelListener):
         new_v = entity.get_verdict(self.verdict_cache)
         if old_v is None or new_v == old_v:
             return  # new entity or no change -> no update
-        js = {"update": {
-            "id": self.get_id(entity),
-            "ent_name": entity.long_name(),  # to help reading JSON events
-            "status": self.get_status_verdict(entity.status, new_v),
-        }}
-        for ln, _ in self.api_listener:
-            ln.note_property_change(js, entity)
+        if self.api_listener:
+            js = {"update": {
+                "id": self.get_id(entity),
+                "ent_name": entity.long_name(),  # to help reading JSON events
+                "status": self.get_status_verdict(entity.status, new_v),
+            }}
+            for ln in self.api_listener:
+                ln.note_property_change(js, entity)
         if isinstance(entity, Service):
             # check if parent verdict changed, too
             self._find_verdict_changes(entity.get_parent_host())
@@ -524,7 +536,7 @@ class ClientPrompt(APIListener):
         self.buffer = []
         self.buffer_index = 0
         # listen for events
-        api.api_listener.append((self, APIRequest(".")))
+        api.api_listener[self] = APIRequest(".")
 
     def prompt_loop(self):
         """Prompt loop"""
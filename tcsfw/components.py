@@ -1,7 +1,7 @@
 """Components for network nodes, hosts, services, etc."""
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Set
+from typing import Iterable, List, Optional, Dict, Set
 
 from tcsfw.release_info import ReleaseInfo
 from tcsfw.model import NodeComponent, Connection, NetworkNode, Host, SensitiveData, Addressable
@@ -111,7 +111,16 @@ class DataStorages(NodeComponent):
     def __init__(self, entity: NetworkNode, name="Sensitive data", data: List[SensitiveData] = None):
         super().__init__(entity, name)
         self.concept_name = "data"
-        self.sub_components: List[DataReference] = [DataReference(self, d) for d in (data or [])]
+        self.sub_components: List[DataReference] = []
+        self.data_set: Set[SensitiveData] = set()  # referred data
+        self.add_data(data or [])
+
+    def add_data(self, data: Iterable[SensitiveData]):
+        """Add references to data, skip data already referred"""
+        for d in data:
+            if d not in self.data_set:
+                self.data_set.add(d)
+                self.sub_components.append(DataReference(self, d))
 
     @classmethod
     def get_storages(cls, entity: NetworkNode, add=False) -> 'DataStorages':
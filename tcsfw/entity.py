@@ -8,7 +8,7 @@ from tcsfw.verdict import Verdict
 
 from tcsfw.claim import AbstractClaim
 from tcsfw.property import Properties, PropertyKey
-from tcsfw.verdict import Verdictable
+from tcsfw.verdict import Verdictable, Verdict_aggregate_pair
 
 
 class Entity:
@@ -24,6 +24,8 @@ class Entity:
 
     def reset(self):
         """Reset entity and at least properties"""
+        if not self.properties:
+            return  # nothing to reset, keep the empty map
         new_p: Dict[PropertyKey, Any] = {}
         for k, v in self.properties.items():
             nv = k.reset(v)
@@ -67,9 +69,11 @@ class Entity:
         v = cache.get(self)
         if v is None:
             for c in self.get_children():
-                v = Verdict.aggregate(v, c.get_verdict(cache))
-            for p in self.properties.values():
-                v = Verdict.aggregate(v, p.get_verdict()) if isinstance(p, Verdictable) else v
+                v = Verdict_aggregate_pair[v, c.get_verdict(cache)]
+            if self.properties:
+                for p in self.properties.values():
+                    if isinstance(p, Verdictable):
+                        v = Verdict_aggregate_pair[v, p.get_verdict()]
             if v == Verdict.PASS:
                 v = self.get_expected_verdict()  # expected has veto
             cache[self] = v = v or Verdict.INCON
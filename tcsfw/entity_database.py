@@ -1,5 +1,6 @@
 """Base class and default database implementation"""
 
+import bisect
 import logging
 from typing import Any, Iterable, Optional, Dict, List
 from tcsfw.event_interface import EventInterface
@@ -47,6 +48,7 @@ class InMemoryDatabase(EntityDatabase):
         EntityDatabase.__init__(self)
         self.trail: List[Event] = []
         self.trail_filter: Dict[str, bool] = {}  # key is label, not present == False
+        self.label_index: Dict[str, List[int]] = {}  # trail indices by label
         self.cursor = 0
 
     def reset(self, source_filter: Dict[str, bool] = None):
@@ -54,21 +56,26 @@ class InMemoryDatabase(EntityDatabase):
         self.trail_filter = source_filter or {}
 
     def next_pending(self) -> Optional[Event]:
-        while self.cursor < len(self.trail):
-            e = self.trail[self.cursor]
-            self.cursor += 1
-            source = e.evidence.source
-            if self.trail_filter.get(source.label, False):
-                self.logger.debug("process #%d %s", self.cursor, e)
-                return e
-            self.logger.debug("filtered #%d %s", self.cursor, e)
-        return None
+        # pick the first index after cursor from the selected labels, skipping filtered events
+        next_i = len(self.trail)
+        for label, index in self.label_index.items():
+            if not self.trail_filter.get(label, False):
+                continue
+            j = bisect.bisect_left(index, self.cursor)
+            if j < len(index) and index[j] < next_i:
+                next_i = index[j]
+        if next_i == len(self.trail):
+            self.cursor = next_i
+            return None
+        e = self.trail[next_i]
+        self.cursor = next_i + 1
+        self.logger.debug("process #%d %s", self.cursor, e)
+        return e
 
     def get_id(self, entity) -> int:
-        i = self.ids.get(entity, -1)
-        if i == -1:
-            self.ids[entity] = i = len(self.ids)
-            self.reverse_id.append(entity)
+        i = self.ids.setdefault(entity, len(self.ids))
+        if i == len(self.reverse_id):
+            self.reverse_id.append(entity)  # new entity
         return i
 
     def get_entity(self, id_value: int) -> Optional[Any]:
@@ -77,6 +84,7 @@ class InMemoryDatabase(EntityDatabase):
     def put_event(self, event: Event):
         if  self.cursor == len(self.trail):
             self.cursor += 1
-        self.trail.append(event)
         source = event.evidence.source
+        self.label_index.setdefault(source.label, []).append(len(self.trail))
+        self.trail.append(event)
         self.trail_filter.setdefault(source.label, True)
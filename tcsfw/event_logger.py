@@ -2,7 +2,7 @@
 
 from logging import Logger
 import logging
-from typing import Any, List, Set, Tuple, Dict, Optional, cast
+from typing import Any, Iterable, List, Set, Tuple, Dict, Optional, cast
 from tcsfw.address import AnyAddress
 from tcsfw.verdict import Verdict
 
@@ -22,6 +22,14 @@ class LoggingEvent:
         self.property_value = property_value  # implicit property set
         self.entity = entity
         self.verdict = Verdict.INCON
+        # property changes caused by the event, expanded to log entries only when asked
+        self.property_changes: List[Tuple[Entity, Tuple[PropertyKey, Any]]] = []
+
+    def iterate_all(self) -> Iterable['LoggingEvent']:
+        """Iterate this and log entries for the property changes"""
+        yield self
+        for ent, value in self.property_changes:
+            yield LoggingEvent(self.event, entity=ent, property_value=value)
 
     def pick_status_verdict(self, entity: Optional[Entity]):
         """Pick current status verdict"""
@@ -51,6 +59,13 @@ class LoggingEvent:
             r.add(ev.key_value[0])
         return r
 
+    def has_property(self, key: PropertyKey) -> bool:
+        """Has implicit or explicit property?"""
+        if self.property_value and self.property_value[0] == key:
+            return True
+        ev = self.event
+        return isinstance(ev, (PropertyEvent, PropertyAddressEvent)) and ev.key_value[0] == key
+
     def __repr__(self):
         v = ""
         if self.entity:
@@ -65,6 +80,8 @@ class EventLogger(EventInterface, ModelListener):
         self.inspector = inspector
         self.logs: List[LoggingEvent] = []
         self.current: Optional[LoggingEvent] = None  # current event
+        # latest source for each entity property, kept up to date when logs are added
+        self.property_sources: Dict[Tuple[Entity, PropertyKey], EvidenceSource] = {}
         inspector.system.model_listeners.append(self) # subscribe property events
         self.event_logger: Optional[Logger] = None
         self.logger = logging.getLogger("events")
@@ -89,9 +106,15 @@ class EventLogger(EventInterface, ModelListener):
         self.current = ev
         return ev
 
+    def _update_sources(self, log: LoggingEvent):
+        """Update property sources by log entry"""
+        for p in log.get_properties():
+            self.property_sources[(log.entity, p)] = log.event.evidence.source
+
     def reset(self):
         """Reset the log"""
         self.logs.clear()
+        self.property_sources.clear()
         self.inspector.reset()
 
     def get_system(self) -> IoTSystem:
@@ -102,10 +125,10 @@ class EventLogger(EventInterface, ModelListener):
             self.logger.warning("Property change without event to assign it: %s", value[0])
             return
         # assign all property changes during an event
-        ev = LoggingEvent(self.current.event, entity=entity, property_value=value)
-        self.logs.append(ev)
+        self.current.property_changes.append((entity, value))
+        self.property_sources[(entity, value[0])] = self.current.event.evidence.source
         if self.event_logger:
-            self.print_event(ev)
+            self.print_event(LoggingEvent(self.current.event, entity=entity, property_value=value))
 
     def connection(self, flow: Flow) -> Optional[Connection]:
         lo = self._add(flow)
@@ -133,6 +156,7 @@ class EventLogger(EventInterface, ModelListener):
         lo = self._add(update)
         e = self.inspector.property_update(update)
         lo.entity = e
+        self._update_sources(lo)
         if self.event_logger:
             self.print_event(lo)
         self.current = None
@@ -142,6 +166,7 @@ class EventLogger(EventInterface, ModelListener):
         lo = self._add(update)
         e = self.inspector.property_address_update(update)
         lo.entity = e
+        self._update_sources(lo)
         if self.event_logger:
             self.print_event(lo)
         self.current = None
@@ -172,8 +197,8 @@ class EventLogger(EventInterface, ModelListener):
             r[c] = []  # expected connections without flows
         for lo in self.logs:
             event = lo.event
-            if not isinstance(event, Flow) or lo.property_value:
-                continue  # only collect pure flows, not property updates
+            if not isinstance(event, Flow):
+                continue  # only collect flows
             c = cast(Connection, lo.entity)
             cs = r.setdefault(c, [])
             s, t = event.get_source_address(), event.get_target_address()
@@ -183,39 +208,26 @@ class EventLogger(EventInterface, ModelListener):
     def get_log(self, entity: Optional[Entity] = None, key: Optional[PropertyKey] = None) \
             -> List[LoggingEvent]:
         """Get log, possibly filtered by entity and key"""
-        ent_set = set()
-
-        def add(n: Entity):
-            ent_set.add(n)
-            for c in n.get_children():
-                add(c)
-        if entity is not None:
-            add(entity)
-
-        r = []
-        for lo in self.logs:
-            if entity is not None and lo.entity not in ent_set:
-                continue
-            if key is not None and key in lo.get_properties():
-                continue
-            r.append(lo)
-        return r
+        ent_set = set(entity.iterate(relevant_only=False)) if entity is not None else None
+        return [lo for log in self.logs for lo in log.iterate_all()
+                if (ent_set is None or lo.entity in ent_set) and (key is None or lo.has_property(key))]
 
     def get_property_sources(self, entity: Entity, keys: Set[PropertyKey]) -> Dict[PropertyKey, EvidenceSource]:
         """Get property sources for an entity and set of properties"""
         r = {}
-        for lo in self.logs:
-            if lo.entity != entity:
-                continue
-            ps = lo.get_properties().intersection(keys)
-            for p in ps:
-                r[p] = lo.event.evidence.source
+        for k in keys:
+            s = self.property_sources.get((entity, k))
+            if s is not None:
+                r[k] = s
         return r
 
     def get_all_property_sources(self) -> Dict[PropertyKey, Dict[EvidenceSource, List[Entity]]]:
         """Get all property sources"""
         r = {}
         for lo in self.logs:
+            source = lo.event.evidence.source
             for p in lo.get_properties():
-                r.setdefault(p, {}).setdefault(lo.event.evidence.source, []).append(lo.entity)
+                r.setdefault(p, {}).setdefault(source, []).append(lo.entity)
+            for ent, (p, _) in lo.property_changes:
+                r.setdefault(p, {}).setdefault(source, []).append(ent)
         return r
@@ -7,17 +7,27 @@ import logging
 import pathlib
 import sys
 import tempfile
-import traceback
-from typing import BinaryIO, Dict, Optional, Tuple, List
+from typing import BinaryIO, Dict, List, Optional, Set, Tuple
 import zipfile
 
 from aiohttp import web, WSMsgType
+import orjson
 
 from tcsfw.client_api import ClientAPI, APIRequest, APIListener
 from tcsfw.command_basics import get_api_key, get_authorization
 from tcsfw.model import IoTSystem
 
 
+def json_response(data: Dict) -> web.Response:
+    """Create JSON response"""
+    return web.Response(body=orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS), content_type="application/json")
+
+
+def json_string(data: Dict) -> str:
+    """Serialize data into JSON string"""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class WebsocketChannel(APIListener):
     """A channel per web socket"""
     def __init__(self, server: 'HTTPServerRunner', socket: web.WebSocketResponse, request: APIRequest):
@@ -25,7 +35,7 @@ class WebsocketChannel(APIListener):
         self.socket = socket
         self.original_request = request
         self.subscribed = False  # subscribed?
-        self.server.api.api_listener.append((self, self.original_request))
+        self.server.api.api_listener[self] = self.original_request
 
     def note_system_reset(self, _data: Dict, _system: IoTSystem):
         if self.subscribed:
@@ -33,17 +43,19 @@ class WebsocketChannel(APIListener):
 
     def note_event(self, data: Dict):
         if self.subscribed:
-            self.server.send_queue.put_nowait((self, data))
+            self.server.send_queue.put_nowait((self, json_string(data)))
 
     def close(self):
         """Close the channel"""
         self.subscribed = False
-        self.server.api.api_listener.remove((self, self.original_request))
+        del self.server.api.api_listener[self]
 
 
 class HTTPServerRunner:
     """Run HTTP server locally"""
     PATH = pathlib.Path("html")
+    CHUNK_SIZE = 65536  # read size for uploaded data
+    ZIP_MEMORY_LIMIT = 16 * 1024 * 1024  # larger uploaded ZIP files are spooled to disk
 
     def __init__(self, api: ClientAPI, base_directory=pathlib.Path("."), port=8180, no_auth_ok=False):
         self.api = api
@@ -52,15 +64,19 @@ class HTTPServerRunner:
         self.host = "127.0.0.1"
         self.port = port
         self.auth_token = get_api_key()
+        self.auth_token_bytes = self.auth_token.encode("utf-8") if self.auth_token else b""
         if not self.auth_token and not no_auth_ok:
             raise ValueError("No TCSFW_SERVER_API_KEY (use --no-auth-ok to skip check)")
         if self.auth_token:
             self.host = None  # allow all hosts, when token is present
         self.component_delay = 0
-        self.channels: List[WebsocketChannel] = []
+        self.channels: Set[WebsocketChannel] = set()
         self.loop = asyncio.get_event_loop()
-        self.send_queue: asyncio.Queue[Tuple[WebsocketChannel, Dict]] = asyncio.Queue()
+        self.send_queue: asyncio.Queue[Tuple[WebsocketChannel, str]] = asyncio.Queue()
         self.send_queue_target_size = 10
+        # serialized model dumps by 'get_visual' flag, valid for model version
+        self.model_cache: Dict[bool, List[str]] = {}
+        self.model_cache_version = -1
 
     def run(self):
         """Start sync loop and run the server"""
@@ -89,10 +105,10 @@ class HTTPServerRunner:
     async def send_worker(self):
         """A worker to send data to websockets"""
         while True:
-            channel, d = await self.send_queue.get()
+            channel, js = await self.send_queue.get()
             if channel.subscribed:
-                self.logger.info("send %s", d)
-                await channel.socket.send_json(d)
+                self.logger.info("send %s", js)
+                await channel.socket.send_str(js)
             self.send_queue.task_done()
             if self.component_delay > 0:
                 # artificial delay for testing
@@ -109,8 +125,7 @@ class HTTPServerRunner:
         else:
             # compare token constant time to avoid timing attacks
             token_1 = auth_t.encode("utf-8")
-            token_2 = self.auth_token.encode("utf-8")
-            if not hmac.compare_digest(token_1, token_2):
+            if not hmac.compare_digest(token_1, self.auth_token_bytes):
                 raise PermissionError("Invalid API key")
 
     async def handle_ping(self, _request: web.Request):
@@ -122,8 +137,9 @@ class HTTPServerRunner:
         try:
             self.check_permission(request)
 
-            assert request.path_qs.startswith("/api1/")
-            req = APIRequest.parse(request.path_qs[6:])
+            path = request.path_qs
+            assert path.startswith("/api1/")
+            req = APIRequest.parse(path.removeprefix("/api1/"))
             self.logger.info("API: %s %s", request.method, req)
             if request.method == "GET":
                 res = self.api.api_get(req)
@@ -141,25 +157,23 @@ class HTTPServerRunner:
                     raise ValueError("Unexpected content-type")
             else:
                 raise NotImplementedError("Unexpected method/path")
-            return web.Response(text=json.dumps(res))
-        except NotImplementedError:
+            return json_response(res)
+        except (NotImplementedError, json.JSONDecodeError):
             return web.Response(status=400)
         except FileNotFoundError:
             return web.Response(status=404)
         except PermissionError:
             return web.Response(status=401)
         except Exception:  # pylint: disable=broad-except
-            traceback.print_exc()
+            self.logger.exception("API error")
             return web.Response(status=500)
 
     async def read_stream_to_file(self, request, file: BinaryIO) -> Optional[BinaryIO]:
         """Read stream to a file, return data or None if no data"""
         r_size = 0
-        b = await request.content.read(1024)
-        while b:
-            r_size += len(b)
-            file.write(b)
-            b = await request.content.read(1024)
+        async for chunk in request.content.iter_chunked(self.CHUNK_SIZE):
+            r_size += len(chunk)
+            file.write(chunk)
         file.seek(0)
         return file if r_size > 0 else None
 
@@ -177,11 +191,11 @@ class HTTPServerRunner:
             content_type = part.headers.get("Content-Type")
             if content_type and content_type != "application/octet-stream":
                 raise ValueError("In multipart form, only application/octet-stream is allowed")
-            chunk = await part.read_chunk()
+            chunk = await part.read_chunk(self.CHUNK_SIZE)
             while chunk:
                 file.write(chunk)
                 r_size += len(chunk)
-                chunk = await part.read_chunk()
+                chunk = await part.read_chunk(self.CHUNK_SIZE)
             part = await reader.next()
         file.seek(0)
         return file if r_size > 0 else None
@@ -190,8 +204,8 @@ class HTTPServerRunner:
         """Handle POST request with zip file"""
         # unzip stream to temporary directory
         with tempfile.TemporaryDirectory() as temp_dir:
-            # create temporary file, extract to directory, delete the temporary file
-            with tempfile.TemporaryFile() as tmp_file:
+            # buffer the ZIP, small ones in memory, extract to directory, delete the buffer
+            with tempfile.SpooledTemporaryFile(max_size=self.ZIP_MEMORY_LIMIT) as tmp_file:
                 if request.content_type == "multipart/form-data":
                     await self.read_multipart_form_to_file(request, tmp_file)
                 else:
@@ -204,8 +218,9 @@ class HTTPServerRunner:
 
     async def handle_ws(self, request: web.Request):
         """Handle websocket HTTP request"""
-        assert request.path_qs.startswith("/api1/ws/")
-        req = APIRequest.parse(request.path_qs[9:])
+        path = request.path_qs
+        assert path.startswith("/api1/ws/")
+        req = APIRequest.parse(path.removeprefix("/api1/ws/"))
         self.logger.info("WS: %s", req)
         if req.path != "model/subscribe":  # the only function
             return web.Response(status=404)
@@ -230,7 +245,7 @@ class HTTPServerRunner:
         channel.subscribed = True
         if req.parameters.get("load_all", "").lower() != "false":  # can avoid JSON dump for debugging
             self.dump_model(channel)
-        self.channels.append(channel)
+        self.channels.add(channel)
 
         async def receive_loop():
             # we expect nothing from client
@@ -253,11 +268,11 @@ class HTTPServerRunner:
         try:
             query_api_key = req.parameters.get("api_key", "").strip()  # development hack to use without proxies!
             res =  {"api_key": query_api_key}  # only echoing back what was given
-            return web.Response(text=json.dumps(res))
+            return json_response(res)
         except PermissionError:
             return web.Response(status=401)
         except Exception:  # pylint: disable=broad-except
-            traceback.print_exc()
+            self.logger.exception("API error")
             return web.Response(status=500)
 
     async def handle_reload(self, request: web.Request):
@@ -278,11 +293,19 @@ class HTTPServerRunner:
             self.loop.call_later(exit_delay / 1000, do_exit)
         else:
             do_exit()  # no response will be sent
-        return web.Response(text=json.dumps(res))
+        return json_response(res)
 
     def dump_model(self, channel: WebsocketChannel):
         """Dump the whole model into channel"""
         if not channel.subscribed:
             return
-        for d in self.api.api_iterate_all(channel.original_request):
-            self.send_queue.put_nowait((channel, d))
+        if self.model_cache_version != self.api.model_version:
+            self.model_cache.clear()
+            self.model_cache_version = self.api.model_version
+        request = channel.original_request
+        dump = self.model_cache.get(request.get_visual)
+        if dump is None:
+            dump = [json_string(d) for d in self.api.api_iterate_all(request)]
+            self.model_cache[request.get_visual] = dump
+        for js in dump:
+            self.send_queue.put_nowait((channel, js))
@@ -1,36 +1,41 @@
 """Model inspector"""
 
 import logging
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from tcsfw.address import DNSName, AnyAddress
-from tcsfw.basics import ExternalActivity, Status
+from tcsfw.basics import ExternalActivity, Status, STATUS_NO_PROPERTIES
 from tcsfw.entity import Entity
 from tcsfw.event_interface import EventInterface, PropertyAddressEvent, PropertyEvent
 from tcsfw.matcher import SystemMatcher
 from tcsfw.model import IoTSystem, Connection, Service, Host, Addressable
 from tcsfw.property import Properties
 from tcsfw.services import NameEvent
-from tcsfw.traffic import ServiceScan, HostScan, Flow, IPFlow
+from tcsfw.traffic import EvidenceSource, ServiceScan, HostScan, Flow, IPFlow
 from tcsfw.verdict import Verdict
 
 
 class Inspector(EventInterface):
-    """Inspector"""
+    """Inspector
+
+    Events are inspected sequentially in arrival order. Flows share the matcher and model state,
+    and listeners (e.g. the event logger) rely on the order of the model events.
+    """
     def __init__(self, system: IoTSystem):
         self.matcher = SystemMatcher(system)
         self.system = system
         self.logger = logging.getLogger("inspector")
-        self.connection_count: Dict[Connection, int] = {}  # count connections
-        self.direction: Dict[Flow, bool] = {}              # direction: false = request, true = reply
+        self.connections: Set[Connection] = set()           # observed connections
+        # known flows: connection, reply?, evidence source, and matcher generation
+        self.flows: Dict[Flow, Tuple[Connection, bool, EvidenceSource, int]] = {}
         self.known_entities: Set[Entity] = set()            # known entities
         self._list_hosts()
 
     def reset(self):
         """Reset the system clearing all evidence"""
         self.matcher.reset()
-        self.connection_count.clear()
-        self.direction.clear()
+        self.connections.clear()
+        self.flows.clear()
         self._list_hosts()
 
     def _list_hosts(self):
@@ -45,17 +50,27 @@ class Inspector(EventInterface):
         self.known_entities.add(entity)
         # new entity, send event
         if isinstance(entity, Connection):
-            self.system.call_listeners(lambda ln: ln.connection_change(entity))
+            self.system.fire_connection_change(entity)
         if isinstance(entity, Host):
-            self.system.call_listeners(lambda ln: ln.host_change(entity))
+            self.system.fire_host_change(entity)
         if isinstance(entity, Service):
-            self.system.call_listeners(lambda ln: ln.service_change(entity))
+            self.system.fire_service_change(entity)
         return True
 
     def get_system(self) -> IoTSystem:
         return self.system
 
     def connection(self, flow: Flow) -> Optional[Connection]:
+        evidence_source, generation = flow.evidence.source, self.matcher.generation
+        known = self.flows.get(flow)
+        if known is not None and known[2] is evidence_source and known[3] == generation:
+            # old connection, old direction, and matcher would give the same result -> discard
+            flow.reply = known[1]
+            return None
+        return self._match_flow(flow, new_direction=known is None)
+
+    def _match_flow(self, flow: Flow, new_direction: bool) -> Optional[Connection]:
+        """Match flow to a connection and update the model, when flow is not known or matching may have changed"""
         self.logger.debug("inspect flow %s", flow)
         key = self.matcher.connection_w_ends(flow)
         conn, _, _, reply = key
@@ -63,29 +78,21 @@ class Inspector(EventInterface):
 
         flow.reply = reply  # bit ugly to fix, but now available for logger
 
-        conn_c = self.connection_count.get(conn, 0) + 1
-        self.connection_count[conn] = conn_c
-        new_conn = conn_c == 1  # new connection?
+        new_conn = conn not in self.connections  # new connection?
+        if new_conn:
+            self.connections.add(conn)
 
-        # detect new sessions
-        conn_dir = self.direction.get(flow)
-        new_direction = conn_dir is None  # new direction?
-        if new_direction:
-            self.direction[flow] = not reply
+        # detect new sessions, new direction given by caller
+        self.flows[flow] = conn, reply, flow.evidence.source, self.matcher.generation
 
         if not (new_conn or new_direction):
             return None  # old connection, old direction -> discard
 
-        updated = set()   # entity which status updated
-        send = set()      # force to send entity update
-
-        def update_seen_status(entity: Addressable):
-            changed = []
-            entity.set_seen_now(changed)
-            updated.update(changed)
+        changed: List[Entity] = []  # entities which status updated, events sent once at the end
 
         # if we have a connection, the endpoints cannot be placeholders
         source, target = conn.source, conn.target
+        source_host, target_host = source.get_parent_host(), target.get_parent_host()
         if source.status == Status.PLACEHOLDER:
             source.status = conn.status
         if target.status == Status.PLACEHOLDER:
@@ -94,27 +101,23 @@ class Inspector(EventInterface):
         if new_conn:
             # new connection is observed
             conn.set_seen_now()
-            updated.add(conn)
+            changed.append(conn)
             # what about learning local IP/HW address pairs
             if isinstance(flow, IPFlow):
-                ends = (conn.target, conn.source) if reply else (conn.source, conn.target)
-                learn = ends[0].get_parent_host().learn_address_pair(flow.source[0], flow.source[1])
-                if learn:
-                    send.add(ends[0])
-                learn = ends[1].get_parent_host().learn_address_pair(flow.target[0], flow.target[1])
-                if learn:
-                    send.add(ends[1])
+                hosts = (target_host, source_host) if reply else (source_host, target_host)
+                hosts[0].learn_address_pair(flow.source[0], flow.source[1])
+                hosts[1].learn_address_pair(flow.target[0], flow.target[1])
 
         if new_direction:
             # new direction, may be old connection
             if not reply:
-                update_seen_status(source)
+                source.set_seen_now(changed)
                 if target.status == Status.UNEXPECTED:
                     # unexpected target fails instantly
-                    update_seen_status(target)
+                    target.set_seen_now(changed)
                 elif conn.target.is_relevant() and conn.target.is_multicast():
                     # multicast updated when sent to
-                    update_seen_status(target)
+                    target.set_seen_now(changed)
                 elif target.status == Status.EXTERNAL:
                     # external target, send update even that verdict remains inconclusve
                     exp = conn.target.get_expected_verdict(default=None)
@@ -122,28 +125,28 @@ class Inspector(EventInterface):
                         target.set_property(Properties.EXPECTED.verdict(Verdict.INCON))
             else:
                 # a reply
-                update_seen_status(target)
+                target.set_seen_now(changed)
 
         # these entities to send events, in this order
-        entities = [conn, source, source.get_parent_host(), target, target.get_parent_host()]
+        entities = [conn, source, source_host, target, target_host]
+        updated = set(changed)
         for ent in entities:
             is_new = self._check_entity(ent)
             if is_new:
                 updated.discard(ent)  # no separate update required
 
         # flow event can carry properties
-        if conn.status == Status.EXPECTED:
+        if flow.properties and conn.status == Status.EXPECTED:
             for p, v in flow.properties.items():
                 # No model events, perhaps later?
                 p.update(conn.properties, v)
-                self.system.call_listeners(
-                    lambda ln: ln.property_change(conn, (p, v)))  # pylint: disable=cell-var-from-loop
+                self.system.fire_property_change(conn, (p, v))
 
         for ent in entities:
             if ent not in updated:
                 continue
             ev = Properties.EXPECTED.verdict(ent.get_expected_verdict())
-            self.system.call_listeners(lambda ln: ln.property_change(ent, ev))  # pylint: disable=cell-var-from-loop
+            self.system.fire_property_change(ent, ev)
             updated.discard(ent)
         return conn
 
@@ -156,15 +159,11 @@ class Inspector(EventInterface):
         if h not in self.known_entities:
             # new host
             if h.status == Status.UNEXPECTED:
-                # unexpected host, check if it can be external
-                for pe in event.peers:
-                    if name in pe.get_parent_host().ignore_name_requests:
-                        # this name is explicitly ok
-                        continue
-                    if pe.external_activity < ExternalActivity.OPEN:
-                        # should not ask or reply with unknown names
-                        h.set_seen_now()
-                        break
+                # unexpected host, check if it can be external.
+                # Peers should not ask or reply with unknown names, unless the name is explicitly ok
+                if any(pe.external_activity < ExternalActivity.OPEN
+                       and name not in pe.get_parent_host().ignore_name_requests for pe in event.peers):
+                    h.set_seen_now()
                 else:
                     # either unknown DNS requester or peers can be externally active
                     h.status = Status.EXTERNAL
@@ -172,12 +171,12 @@ class Inspector(EventInterface):
         elif not changes:
             # old host and nothing learned -> stop this maddness to save resources
             return None
-        self.system.call_listeners(lambda ln: ln.address_change(h))
+        self.system.fire_address_change(h)
         return h
 
     def property_update(self, update: PropertyEvent) -> Entity:
         s = update.entity
-        if s.status in {Status.PLACEHOLDER, Status.UNEXPECTED}:
+        if s.status in STATUS_NO_PROPERTIES:
             # no properties for placeholders or unexpected entities
             return s
         key, val = update.key_value
@@ -186,7 +185,7 @@ class Inspector(EventInterface):
             return None
         key.update(s.properties, val)
         # call listeners
-        self.system.call_listeners(lambda ln: ln.property_change(s, (key, val)))
+        self.system.fire_property_change(s, (key, val))
         return s
 
     def property_address_update(self, update: PropertyAddressEvent) -> Entity:
@@ -194,7 +193,7 @@ class Inspector(EventInterface):
         s = self._get_seen_entity(add)
         if s is None:
             raise NotImplementedError(f"Processing properties for {add} not implemented")
-        if s.status in {Status.PLACEHOLDER, Status.UNEXPECTED}:
+        if s.status in STATUS_NO_PROPERTIES:
             # no properties for placeholders or unexpected entities
             return s
         key, val = update.key_value
@@ -203,7 +202,7 @@ class Inspector(EventInterface):
             return s
         key.update(s.properties, val)
         # call listeners
-        self.system.call_listeners(lambda ln: ln.property_change(s, (key, val)))
+        self.system.fire_property_change(s, (key, val))
         return s
 
     def service_scan(self, scan: ServiceScan) -> Service:
@@ -220,22 +219,19 @@ class Inspector(EventInterface):
     def host_scan(self, scan: HostScan) -> Host:
         host = self.system.get_endpoint(scan.host)
         assert isinstance(host, Host), f"Address {scan.host} is not for a Host"
+        scan_host, endpoints = scan.host, scan.endpoints
         for c in host.children:
             if isinstance(c, Service):
                 if c.client_side or not c.is_tcp_service():
                     continue  # only server TCP services are scannable
             if not c.is_relevant():
                 continue  # verdict does not need checking
-            for a in c.addresses:
-                if a in scan.endpoints:
-                    break
-                if a.is_wildcard() and a.change_host(scan.host) in scan.endpoints:
-                    break
-            else:
+            if not any(a in endpoints or (a.is_wildcard() and a.change_host(scan_host) in endpoints)
+                       for a in c.addresses):
                 # child address not in scan results
                 c.set_property(Properties.EXPECTED.verdict(Verdict.FAIL))
         self.known_entities.add(host)
-        self.system.call_listeners(lambda ln: ln.host_change(host))
+        self.system.fire_host_change(host)
         return host
 
     def _get_seen_entity(self, endpoint: AnyAddress) -> Addressable:
@@ -244,7 +240,7 @@ class Inspector(EventInterface):
         change = ent.set_seen_now()
         if change and ent.status == Status.EXPECTED:
             value = Properties.EXPECTED, Properties.EXPECTED.get(ent.properties)
-            self.system.call_listeners(lambda ln: ln.property_change(ent, value))
+            self.system.fire_property_change(ent, value)
         return ent
 
     def __repr__(self):
@@ -2,18 +2,18 @@
 
 import asyncio
 from asyncio.subprocess import Process
+import json
 import logging
 import os
 import argparse
+from collections import deque
 import pathlib
 import re
 import secrets
-import subprocess
 import sys
 import traceback
-from typing import Dict, Optional, Set, Tuple
+from typing import Deque, Dict, Optional, Tuple
 
-import aiofiles
 from aiohttp import web
 import aiohttp
 
@@ -44,10 +44,11 @@ class Launcher:
 
         # NOTE: Nginx accepts port range 10000-19999
         self.client_port_range = (10000, 11000)
-        self.clients: Set[int] = set()
-        self.connected: Dict[Tuple[str, str], int] = {}  # key: user, app
+        self.free_ports: Deque[int] = deque(range(*self.client_port_range))
+        self.connected: Dict[Tuple[str, str], int] = {}  # key: user, app, value: port of running process
         self.api_keys: Dict[str, str] = {}
         self.api_key_reverse: Dict[str, str] = {}
+        self.proxy_responses: Dict[Tuple[str, str], bytes] = {}  # serialized proxy responses for running processes
 
         self.change_observer: Optional[FileChangeObserver] = None
         if args.watch:
@@ -121,14 +122,13 @@ class Launcher:
             explicit_key = api_req.parameters.get("instance-key")
             app_key = f"{app}/{explicit_key}" if explicit_key else app
             key = user_name, app_key
-            api_port = await self.run_process(key, app, api_key=api_key)
-            res = {"api_proxy": api_port}
-
-            if not use_api_key:
+            if use_api_key:
+                body = await self.proxy_response(key, app, api_key)
+            else:
+                api_port = await self.run_process(key, app, api_key=api_key)
                 # return the generated API key
-                res = res.copy()
-                res.update({"api_key": api_key})
-            return web.json_response(res)
+                body = json.dumps({"api_proxy": api_port, "api_key": api_key}).encode()
+            return web.Response(body=body, content_type="application/json")
         except NotImplementedError:
             return web.Response(status=400)
         except FileNotFoundError:
@@ -139,6 +139,17 @@ class Launcher:
             traceback.print_exc()
             return web.Response(status=500)
 
+    async def proxy_response(self, key: Tuple[str, str], app: str, api_key: str) -> bytes:
+        """Get serialized proxy response, run process if not already running"""
+        body = self.proxy_responses.get(key)
+        if body:
+            return body  # already running
+        api_port = await self.run_process(key, app, api_key=api_key)
+        body = json.dumps({"api_proxy": api_port}).encode()
+        if key in self.connected:
+            self.proxy_responses[key] = body
+        return body
+
     async def run_process(self, key: Tuple[str, str], app: str, api_key: str) -> int:
         """Run process by request, key: user, application"""
 
@@ -155,21 +166,16 @@ class Launcher:
         if known_port:
             return known_port  # already running
 
-        client_port = None
-        for port in range(*self.client_port_range):
-            if port not in self.clients:
-                client_port = port
-                break
-        else:
-            raise FileNotFoundError("No free ports available")
-        self.clients.add(client_port)
-        self.connected[key] = client_port
-
         python_app = f"{app}.py"
         app_file = pathlib.Path(python_app)
         if not app_file.exists():
             raise FileNotFoundError(f"App not found: {python_app}")
 
+        if not self.free_ports:
+            raise FileNotFoundError("No free ports available")
+        client_port = self.free_ports.popleft()
+        self.connected[key] = client_port
+
         args = [sys.executable, python_app, "--http-server", f"{client_port}"]
         if self.db_base_dir:
             # use sqlite DB for the app
@@ -181,26 +187,24 @@ class Launcher:
         env["TCSFW_SERVER_API_KEY"] = api_key
 
         # schedule process execution by asyncio and return the port
-        process = await asyncio.create_subprocess_exec(*args,
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+        # process output goes directly to log files, our handles are not needed after start
         stdout_file = f'stdout-{client_port}.log'
         stderr_file = f'stderr-{client_port}.log'
-        stdout_task = asyncio.create_task(self.save_stream_to_file(process.stdout, stdout_file))
-        stderr_task = asyncio.create_task(self.save_stream_to_file(process.stderr, stderr_file))
+        with open(stdout_file, 'wb') as stdout_f, open(stderr_file, 'wb') as stderr_f:
+            process = await asyncio.create_subprocess_exec(*args, stdout=stdout_f, stderr=stderr_f, env=env)
 
         async def wait_process():
             await process.wait()
-            await stdout_task
-            await stderr_task
             # free port, but leave keys in place
-            self.clients.remove(client_port)
-            self.connected.pop(key, None)
+            self.free_ports.append(client_port)
+            del self.connected[key]
+            self.proxy_responses.pop(key, None)
             self.logger.info("Exit code %s from %s at port %d", process.returncode, key_str, client_port)
             if self.change_observer:
                 self.change_observer.update_watch_list(process, remove=app_file.parent)
             # remove log files
-            os.remove(stdout_file)
-            os.remove(stderr_file)
+            for log_file in (stdout_file, stderr_file):
+                pathlib.Path(log_file).unlink(missing_ok=True)
 
         asyncio.create_task(wait_process())
 
@@ -210,7 +214,7 @@ class Launcher:
         ping_url = f"http://localhost:{client_port}/api1/ping"
         self.logger.info("Pinging %s...", ping_url)
         while True:
-            if client_port not in self.clients:
+            if self.connected.get(key) != client_port:
                 self.logger.info("Process failed/killed without starting")
                 raise FileNotFoundError("Process failed to start")
             try:
@@ -226,15 +230,6 @@ class Launcher:
             self.change_observer.update_watch_list(process, add=app_file.parent)
         return client_port
 
-    async def save_stream_to_file(self, stream, file_path):
-        """Save data from stream to a file asynchronously"""
-        async with aiofiles.open(file_path, 'wb') as f:
-            while True:
-                chunk = await stream.read(64 * 1024)
-                if not chunk:
-                    break
-                await f.write(chunk)
-
     def generate_api_key(self, user_name: str) -> str:
         """Generate API key for the user"""
         # get secure random bytes
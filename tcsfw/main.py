@@ -245,21 +245,32 @@ class VisualizerBuilder:
 
 class ProtocolConfigurer:
     """Protocol configurer base class"""
+    __slots__ = ('name',)
+
     def __init__(self, name: str):
         self.name = name
 
+    def get_values(self) -> Tuple:
+        """Get the configured values, including the configurer type"""
+        return (self.__class__, ) + tuple(getattr(self, s) for c in self.__class__.__mro__
+                                          for s in getattr(c, "__slots__", ()))
+
     def __repr__(self) -> str:
         return self.name
 
 
 class ARP(ProtocolConfigurer):
     """ARP configurer"""
+    __slots__ = ()
+
     def __init__(self):
         ProtocolConfigurer.__init__(self, "ARP")
 
 
 class DHCP(ProtocolConfigurer):
     """DHCP configurer"""
+    __slots__ = ('port',)
+
     def __init__(self, port=67):
         ProtocolConfigurer.__init__(self, "DHCP")
         self.port = port
@@ -267,6 +278,8 @@ class DHCP(ProtocolConfigurer):
 
 class DNS(ProtocolConfigurer):
     """DNS configurer"""
+    __slots__ = ('port', 'captive')
+
     def __init__(self, port=53, captive=False):
         ProtocolConfigurer.__init__(self, "DNS")
         self.port = port
@@ -275,12 +288,16 @@ class DNS(ProtocolConfigurer):
 
 class EAPOL(ProtocolConfigurer):
     """EAPOL configurer"""
+    __slots__ = ()
+
     def __init__(self):
         ProtocolConfigurer.__init__(self, "EAPOL")
 
 
 class HTTP(ProtocolConfigurer):
     """HTTP configurer"""
+    __slots__ = ('port', 'auth', 'redirect_only')
+
     def __init__(self, port=80, auth: Optional[bool] = None):
         ProtocolConfigurer.__init__(self, "HTTP")
         self.port = port
@@ -295,12 +312,16 @@ class HTTP(ProtocolConfigurer):
 
 class ICMP(ProtocolConfigurer):
     """ICMP configurer"""
+    __slots__ = ()
+
     def __init__(self):
         ProtocolConfigurer.__init__(self, "ICMP")
 
 
 class IP(ProtocolConfigurer):
     """IPv4 or v6 configurer"""
+    __slots__ = ('administration',)
+
     def __init__(self, name="IP", administration=False):
         ProtocolConfigurer.__init__(self, name)
         self.administration = administration
@@ -308,6 +329,8 @@ class IP(ProtocolConfigurer):
 
 class TLS(ProtocolConfigurer):
     """TLS configurer"""
+    __slots__ = ('port', 'auth')
+
     def __init__(self, port=443, auth: Optional[bool] = None):
         ProtocolConfigurer.__init__(self, "TLS")
         self.port = port
@@ -316,6 +339,8 @@ class TLS(ProtocolConfigurer):
 
 class NTP(ProtocolConfigurer):
     """NTP configurer"""
+    __slots__ = ('port',)
+
     def __init__(self, port=123):
         ProtocolConfigurer.__init__(self, "NTP")
         self.port = port
@@ -323,6 +348,8 @@ class NTP(ProtocolConfigurer):
 
 class SSH(ProtocolConfigurer):
     """SSH configurer"""
+    __slots__ = ('port',)
+
     def __init__(self, port=22):
         ProtocolConfigurer.__init__(self, "SSH")
         self.port = port
@@ -330,6 +357,8 @@ class SSH(ProtocolConfigurer):
 
 class TCP(ProtocolConfigurer):
     """TCP configurer"""
+    __slots__ = ('port', 'administrative')
+
     def __init__(self, port: int, name="TCP", administrative=False):
         ProtocolConfigurer.__init__(self, name)
         self.port = port
@@ -339,6 +368,8 @@ class TCP(ProtocolConfigurer):
 
 class UDP(ProtocolConfigurer):
     """UDP configurer"""
+    __slots__ = ('port', 'administrative')
+
     def __init__(self, port: int, name="UDP", administrative=False):
         ProtocolConfigurer.__init__(self, name)
         self.port = port
@@ -348,6 +379,8 @@ class UDP(ProtocolConfigurer):
 
 class BLEAdvertisement(ProtocolConfigurer):
     """BLE advertisement configurer"""
+    __slots__ = ('event_type',)
+
     def __init__(self, event_type: int):
         ProtocolConfigurer.__init__(self, "BLE Ad")
         self.event_type = event_type
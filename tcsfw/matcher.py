@@ -17,12 +17,14 @@ class SystemMatcher(ModelListener):
         self.system = system
         self.engines: Dict[EvidenceSource, MatchEngine] = {}
         self.host_addresses = {c: c.addresses.copy() for c in system.children}
+        self.generation = 0  # incremented when observed flows may match different connections
         system.model_listeners.append(self)
 
     def reset(self) -> 'SystemMatcher':
         """Reset the model"""
         self.engines.clear()
         self.system.reset()
+        self.generation += 1
         return self
 
     def address_change(self, host: Host):
@@ -282,6 +284,8 @@ class MatchEngine:
                 new_m = ConnectionMatch(new_c, om.source, om.target, om.reply)
                 new_obs[of] = new_m
         self.observed.update(new_obs)
+        if new_obs:
+            self.system.generation += 1
 
     def add_connection(self, flow: Flow) -> ConnectionMatch:
         """Add new connection"""
@@ -7,7 +7,7 @@ from typing import List, Set, Optional, Tuple, TypeVar, Callable, Dict, Any, Sel
 from urllib.parse import urlparse
 
 from tcsfw.address import AnyAddress, Addresses, EndpointAddress, Protocol, IPAddress, HWAddress, DNSName
-from tcsfw.basics import ConnectionType, ExternalActivity, HostType, Status
+from tcsfw.basics import ConnectionType, ExternalActivity, HostType, Status, STATUS_RELEVANT
 from tcsfw.entity import Entity
 from tcsfw.property import PropertyKey
 from tcsfw.traffic import Flow, EvidenceSource
@@ -30,7 +30,7 @@ class Connection(Entity):
 
     def is_relevant(self, ignore_ends=False) -> bool:
         """Is this connection relevant, i.e. not placeholder or external?"""
-        if self.status in {Status.EXPECTED, Status.UNEXPECTED}:
+        if self.status in STATUS_RELEVANT:
             return True
         if self.status == Status.PLACEHOLDER:
             return False  # placeholder is never relevant
@@ -158,7 +158,7 @@ class NetworkNode(Entity):
         return False
 
     def is_relevant(self) -> bool:
-        return self.status in {Status.EXPECTED, Status.UNEXPECTED}
+        return self.status in STATUS_RELEVANT
 
     def get_connections(self, relevant_only=True) -> List[Connection]:
         """Get relevant conneciions"""
@@ -555,12 +555,12 @@ class IoTSystem(NetworkNode):
             nn = f"{Addresses.get_prioritized(host.addresses)}"
             if nn != host.name:
                 host.name = self.free_child_name(nn)
-        self.call_listeners(lambda ln: ln.address_change(host))
+        self.fire_address_change(host)
 
         for h in self.get_hosts():
             if h != host:
                 h.addresses.discard(ip_address)
-                self.call_listeners(lambda ln: ln.address_change(h))  # pylint: disable=cell-var-from-loop
+                self.fire_address_change(h)
 
     def get_system(self) -> 'IoTSystem':
         return self
@@ -623,6 +623,31 @@ class IoTSystem(NetworkNode):
         for ln in self.model_listeners:
             fun(ln)
 
+    def fire_connection_change(self, connection: Connection):
+        """Call model listeners for connection change"""
+        for ln in self.model_listeners:
+            ln.connection_change(connection)
+
+    def fire_host_change(self, host: Host):
+        """Call model listeners for host change"""
+        for ln in self.model_listeners:
+            ln.host_change(host)
+
+    def fire_address_change(self, host: Host):
+        """Call model listeners for address change"""
+        for ln in self.model_listeners:
+            ln.address_change(host)
+
+    def fire_service_change(self, service: Service):
+        """Call model listeners for service change"""
+        for ln in self.model_listeners:
+            ln.service_change(service)
+
+    def fire_property_change(self, entity: Entity, value: Tuple[PropertyKey, Any]):
+        """Call model listeners for property change"""
+        for ln in self.model_listeners:
+            ln.property_change(entity, value)
+
     def parse_url(self, url: str) -> Tuple[Service, str]:
         """Parse URL and return the service and path"""
         u = urlparse(url)
@@ -12,6 +12,7 @@ class PropertyKey:
         """Create new property key"""
         self.segments: Tuple[str, ...] = name, *more
         self.model = False  # a model property?
+        self.segments_hash = hash(self.segments)  # keys are compared a lot, hash once
 
     def persistent(self) -> Self:
         """Make a persistent property"""
@@ -82,12 +83,14 @@ class PropertyKey:
             properties[self] = value
 
     def __hash__(self):
-        return self.segments.__hash__()
+        return self.segments_hash
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, PropertyKey):
             return False
-        return self.segments == other.segments
+        return self.segments_hash == other.segments_hash and self.segments == other.segments
 
     def __gt__(self, other):
         return self.segments.__gt__(other.segments)
@@ -135,6 +138,8 @@ class PropertyKey:
     def verdict(self, verdict=Verdict.INCON, explanation="") -> Tuple['PropertyKey', 'PropertyVerdictValue']:
         """New key and verdict value """
         assert isinstance(verdict, Verdict)
+        if not explanation:
+            return self, PropertyVerdictValue_plain[verdict]
         return self, PropertyVerdictValue(verdict, explanation)
 
     def put_verdict(self, properties: 'PropertyDict', verdict=Verdict.INCON,
@@ -201,7 +206,7 @@ class PropertyKey:
 PropertyDict = Dict[PropertyKey, Any]
 
 
-@dataclass
+@dataclass(frozen=True)
 class PropertyVerdictValue(Verdictable):
     """Verdict as property value, explanation optional"""
     verdict: Verdict
@@ -215,6 +220,10 @@ class PropertyVerdictValue(Verdictable):
         return f"[{self.verdict.value}]{s}"
 
 
+# Shared verdict values without explanation, values are immutable
+PropertyVerdictValue_plain: Dict[Verdict, PropertyVerdictValue] = {v: PropertyVerdictValue(v) for v in Verdict}
+
+
 @dataclass
 class PropertySetValue:
     """Set of keys as property value, explanation optional"""
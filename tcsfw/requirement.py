@@ -22,6 +22,10 @@ class EntitySelector:
 
 class SelectorContext:
     """Selector context"""
+    def __init__(self):
+        # entities selected by selector stages, the model must not change while context is used
+        self.stage_cache: Dict[Tuple[Any, Entity], List[Entity]] = {}
+
     def include_host(self, entity: Host) -> bool:
         """Is the given host included?"""
         return entity.is_relevant()
@@ -1,6 +1,6 @@
 """Requirement selectors"""
 
-from typing import List, TypeVar, Generic, Iterator
+from typing import Callable, List, TypeVar, Generic, Iterator
 
 from tcsfw.address import Protocol
 from tcsfw.basics import HostType
@@ -19,6 +19,8 @@ class RequirementSelector(EntitySelector):
     def __truediv__(self, other: S) -> S:
         """Add more specific location"""
         assert isinstance(other, RequirementSelector), f"Expected location selector, got: {other}"
+        if isinstance(other, SequenceSelector):
+            return SequenceSelector([self] + other.pre, other.sub)  # flat sequence
         return SequenceSelector([self], other)
 
     def __add__(self, other: 'RequirementSelector') -> 'RequirementSelector':
@@ -30,6 +32,16 @@ class RequirementSelector(EntitySelector):
         return Requirement(("", ""), other.description, self, other)
 
 
+class FilteredSelector(RequirementSelector):
+    """Selector passing through the entities of a parent selector accepted by a predicate"""
+    def __init__(self, parent: RequirementSelector, predicate: Callable[[Entity], bool]):
+        self.parent = parent
+        self.predicate = predicate
+
+    def select(self, entity: Entity, context: SelectorContext) -> Iterator[Entity]:
+        return filter(self.predicate, self.parent.select(entity, context))
+
+
 class NamedSelector(RequirementSelector):
     """A named selector"""
     def __init__(self, name: str, sub: EntitySelector):
@@ -69,24 +81,16 @@ class HostSelector(RequirementSelector):
 
     def type_of(self, *host_type: HostType) -> 'HostSelector':
         """Select by host types"""
-        parent = self
         types = set(host_type)
-
-        class Selector(HostSelector):
-            """The modified selector"""
-            def select(self, entity: Entity, context: SelectorContext) -> Iterator[Entity]:
-                return (c for c in parent.select(entity, context) if c.host_type in types)
-        return Selector()
+        return FilteredHostSelector(self, lambda c: c.host_type in types)
 
     def with_property(self, key: PropertyKey) -> 'HostSelector':
         """Select hosts with a property"""
-        parent = self
+        return FilteredHostSelector(self, lambda c: key in c.properties)
 
-        class Selector(HostSelector):
-            """The modified selector"""
-            def select(self, entity: Entity, context: SelectorContext) -> Iterator[Entity]:
-                return (c for c in parent.select(entity, context) if key in c.properties)
-        return Selector()
+
+class FilteredHostSelector(FilteredSelector, HostSelector):
+    """Host selector with a filter"""
 
 
 class ServiceSelector(RequirementSelector):
@@ -107,35 +111,20 @@ class ServiceSelector(RequirementSelector):
 
     def authenticated(self, value=True) -> 'ServiceSelector':
         """Select authenticated services"""
-        parent = self
-
-        class Selector(ServiceSelector):
-            """The modified selector"""
-            def select(self, entity: Entity, context: SelectorContext) -> Iterator[Service]:
-                return (c for c in parent.select(entity, context) if c.authentication == value)
-        return Selector()
+        return FilteredServiceSelector(self, lambda c: c.authentication == value)
 
     def web(self) -> 'ServiceSelector':
         """Select web services"""
-        parent = self
-
-        class Selector(ServiceSelector):
-            """The modified selector"""
-            def select(self, entity: Entity, context: SelectorContext) -> Iterator[Service]:
-                return (c for c in parent.select(entity, context) if c.protocol in {Protocol.HTTP, Protocol.TLS})
-        return Selector()
+        return FilteredServiceSelector(self, lambda c: c.protocol in {Protocol.HTTP, Protocol.TLS})
 
     def direct(self) -> 'ServiceSelector':
         """Select direct services"""
-        parent = self
+        return FilteredServiceSelector(
+            self, lambda c: not c.is_multicast() and Properties.HTTP_REDIRECT.get(c.properties) is None)
 
-        class Selector(ServiceSelector):
-            """The modified selector"""
-            def select(self, entity: Entity, context: SelectorContext) -> Iterator[Connection]:
-                for c in parent.select(entity, context):
-                    if not c.is_multicast() and Properties.HTTP_REDIRECT.get(c.properties) is None:
-                        yield c
-        return Selector()
+
+class FilteredServiceSelector(FilteredSelector, ServiceSelector):
+    """Service selector with a filter"""
 
 
 class ConnectionSelector(RequirementSelector):
@@ -163,41 +152,19 @@ class ConnectionSelector(RequirementSelector):
 
     def encrypted(self) -> 'ConnectionSelector':
         """Select encrypted connections"""
-        parent = self
-
-        class Selector(ConnectionSelector):
-            """The modified selector"""
-            def select(self, entity: Entity, context: SelectorContext) -> Iterator[Connection]:
-                for c in parent.select(entity, context):
-                    if c.is_encrypted():
-                        yield c
-        return Selector()
+        return FilteredConnectionSelector(self, Connection.is_encrypted)
 
     def authenticated(self) -> 'ConnectionSelector':
         """Select authenticated connections"""
-        parent = self
-
-        class Selector(ConnectionSelector):
-            """The modified selector"""
-            def select(self, entity: Entity, context: SelectorContext) -> Iterator[Connection]:
-                for c in parent.select(entity, context):
-                    target = c.target
-                    if isinstance(target, Service) and target.authentication:
-                        yield c
-        return Selector()
+        return FilteredConnectionSelector(
+            self, lambda c: isinstance(c.target, Service) and c.target.authentication)
 
     def protocol(self, name: str) -> 'ConnectionSelector':
         """Select connections by protocol"""
-        parent = self
-
-        class Selector(ConnectionSelector):
-            """The modified selector"""
-            def select(self, entity: Entity, context: SelectorContext) -> Iterator[Connection]:
-                for c in parent.select(entity, context):
-                    target = c.target
-                    if isinstance(target, Service) and target.protocol and target.protocol.value == name:
-                        yield c
-        return Selector()
+        def is_protocol(c: Connection) -> bool:
+            target = c.target
+            return isinstance(target, Service) and target.protocol is not None and target.protocol.value == name
+        return FilteredConnectionSelector(self, is_protocol)
 
     def endpoint(self, endpoint: RequirementSelector) -> 'ConnectionSelector':
         """Select connections by endpoint"""
@@ -214,6 +181,10 @@ class ConnectionSelector(RequirementSelector):
         return Selector()
 
 
+class FilteredConnectionSelector(FilteredSelector, ConnectionSelector):
+    """Connection selector with a filter"""
+
+
 class UpdateConnectionSelector(ConnectionSelector):
     """Select update connections of a software"""
     def select(self, entity: Entity, context: SelectorContext) -> Iterator[Connection]:
@@ -224,9 +195,15 @@ class UpdateConnectionSelector(ConnectionSelector):
 class SoftwareSelector(RequirementSelector):
     """Select software entities"""
     def select(self, entity: Entity, context: SelectorContext) -> Iterator[Software]:
-        for h in HostSelector().select(entity, context):
-            if not h.is_multicast():  # Multicast node does not contain software
-                yield from Software.list_software(h)
+        # software is selected for many requirements, keep the result for the context
+        key = SoftwareSelector, entity
+        sw = context.stage_cache.get(key)
+        if sw is None:
+            sw = context.stage_cache[key] = [
+                s for h in HostSelector().select(entity, context)
+                if not h.is_multicast()  # Multicast node does not contain software
+                for s in Software.list_software(h)]
+        return iter(sw)
 
 
 class DataSelector(RequirementSelector):
@@ -240,23 +217,11 @@ class DataSelector(RequirementSelector):
 
     def personal(self, value=True) -> 'DataSelector':
         """Select personal data"""
-        parent = self
-
-        class Selector(DataSelector):
-            """The modified selector"""
-            def select(self, entity: Entity, context: SelectorContext) -> Iterator[DataReference]:
-                return (c for c in parent.select(entity, context) if c.data.personal == value)
-        return Selector()
+        return FilteredDataSelector(self, lambda c: c.data.personal == value)
 
     def passwords(self, value=True) -> 'DataSelector':
         """Select password security parameters"""
-        parent = self
-
-        class Selector(DataSelector):
-            """The modified selector"""
-            def select(self, entity: Entity, context: SelectorContext) -> Iterator[DataReference]:
-                return (c for c in parent.select(entity, context) if c.data.password == value)
-        return Selector()
+        return FilteredDataSelector(self, lambda c: c.data.password == value)
 
     def parameters(self, value=True) -> 'DataSelector':
         """Select security parameter data"""
@@ -264,6 +229,10 @@ class DataSelector(RequirementSelector):
         return self.personal(not value)
 
 
+class FilteredDataSelector(FilteredSelector, DataSelector):
+    """Data selector with a filter"""
+
+
 SS = TypeVar("SS", bound='EntitySelector')
 
 
@@ -276,10 +245,14 @@ class SequenceSelector(Generic[SS], RequirementSelector):
 
     def select(self, entity: Entity, context: SelectorContext) -> Iterator[SS]:
         e_set = [entity]
+        cache = context.stage_cache
         for s in self.pre:
             n_set = []
             for e in e_set:
-                n_set.extend(s.select(e, context))
+                sel = cache.get((s, e))
+                if sel is None:
+                    sel = cache[s, e] = list(s.select(e, context))
+                n_set.extend(sel)
             if not n_set:
                 return
             e_set = n_set
@@ -287,8 +260,9 @@ class SequenceSelector(Generic[SS], RequirementSelector):
             yield from self.sub.select(e, context)
 
     def __truediv__(self, other: S) -> S:
-        pre = self.pre.copy()
-        pre.append(self.sub)
+        pre = self.pre + [self.sub]
+        if isinstance(other, SequenceSelector):
+            return SequenceSelector(pre + other.pre, other.sub)  # flat sequence
         return SequenceSelector(pre, other)
 
 
@@ -311,17 +285,17 @@ class Select:
     @classmethod
     def host(cls, unexpected=False) -> HostSelector:
         """Select hosts"""
-        return HostSelector(unexpected)
+        return HostSelector(True) if unexpected else cls.HOST_SINGLE
 
     @classmethod
     def service(cls, unexpected=False) -> ServiceSelector:
         """Select services"""
-        return ServiceSelector(unexpected)
+        return ServiceSelector(True) if unexpected else cls.SERVICE_SINGLE
 
     @classmethod
     def connection(cls, unexpected=False) -> ConnectionSelector:
         """Select connections"""
-        return ConnectionSelector(unexpected)
+        return ConnectionSelector(True) if unexpected else cls.CONNECTION_SINGLE
 
     @classmethod
     def system(cls) -> SystemSelector:
@@ -336,7 +310,11 @@ class Select:
     @classmethod
     def data(cls) -> DataSelector:
         """Select data"""
-        return DataSelector()
+        return cls.DATA_SINGLE  # singleton now
 
     SYSTEM_SINGLE = SystemSelector()
     SOFTWARE_SINGLE = SoftwareSelector()
+    HOST_SINGLE = HostSelector()
+    SERVICE_SINGLE = ServiceSelector()
+    CONNECTION_SINGLE = ConnectionSelector()
+    DATA_SINGLE = DataSelector()
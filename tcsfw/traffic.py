@@ -156,6 +156,7 @@ class Flow(Event):
         self.reply = False  # Is this reply? Set by inspector
         self.timestamp: Optional[datetime.datetime] = None
         self.properties: Dict[PropertyKey, Any] = {}  # optional properties for the connection
+        self.flow_hash: Optional[int] = None  # cached hash, flows are used as keys a lot
 
     def stack(self, target: bool) -> Tuple[AnyAddress]:
         """Get source or target address stack"""
@@ -260,11 +261,13 @@ class EthernetFlow(Flow):
 
     def __rshift__(self, target: str) -> 'EthernetFlow':
         self.target = HWAddress.new(target)
+        self.flow_hash = None
         return self
 
     def __lshift__(self, source: str) -> 'EthernetFlow':
         self.target = self.source
         self.source = HWAddress.new(source)
+        self.flow_hash = None
         return self
 
     def __repr__(self):
@@ -274,7 +277,9 @@ class EthernetFlow(Flow):
         return f"{s} >> {t}{pt} {self.protocol.value.upper()}"
 
     def __hash__(self):
-        return self.source.__hash__() ^ self.target.__hash__() ^ self.payload ^ self.protocol.__hash__()
+        if self.flow_hash is None:
+            self.flow_hash = self.source.__hash__() ^ self.target.__hash__() ^ self.payload ^ self.protocol.__hash__()
+        return self.flow_hash
 
     def __eq__(self, other):
         if not isinstance(other, EthernetFlow):
@@ -381,11 +386,13 @@ class IPFlow(Flow):
 
     def __rshift__(self, target: Tuple[str, str, int]) -> 'IPFlow':
         self.target = HWAddress.new(target[0]), IPAddress.new(target[1]), target[2]
+        self.flow_hash = None
         return self
 
     def __lshift__(self, source: Tuple[str, str, int]) -> 'IPFlow':
         self.target = self.source
         self.source = HWAddress.new(source[0]), IPAddress.new(source[1]), source[2]
+        self.flow_hash = None
         return self
 
     def __repr__(self):
@@ -394,7 +401,9 @@ class IPFlow(Flow):
         return f"{s[0]} {s[1]}:{s[2]} >> {t[0]} {t[1]}:{t[2]} {self.protocol.value.upper()}"
 
     def __hash__(self):
-        return self.source.__hash__() ^ self.target.__hash__() ^ self.protocol.__hash__()
+        if self.flow_hash is None:
+            self.flow_hash = self.source.__hash__() ^ self.target.__hash__() ^ self.protocol.__hash__()
+        return self.flow_hash
 
     def __eq__(self, other):
         if not isinstance(other, IPFlow):
@@ -1,7 +1,7 @@
 """Verdicts and related classes"""
 
 import enum
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
 class Verdict(enum.Enum):
@@ -49,6 +49,11 @@ class Verdict(enum.Enum):
 # Map verdicts to verdict values in lowercase
 Verdict_by_value = {v.value.lower(): v for v in Verdict}
 
+# Aggregate verdict for verdict pairs, first can be None, to avoid calls in tight loops
+Verdict_aggregate_pair: Dict[Tuple[Optional[Verdict], Optional[Verdict]], Verdict] = {
+    (v1, v2): Verdict.aggregate(v1, v2) for v1 in (None, *Verdict) for v2 in (None, *Verdict)
+}
+
 class Verdictable:
     """Base class for objects with verdict"""
     def get_verdict(self) -> Verdict:
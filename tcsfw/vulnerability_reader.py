@@ -28,12 +28,11 @@ class VulnerabilityReader(ComponentCheckTool):
         software = cast(Software, component)
         evidence = Evidence(source)
 
-        with TextIOWrapper(data_file) as f:
+        with TextIOWrapper(data_file, newline="") as f:
             reader = csv.reader(f, delimiter=",")
+            next(reader, None)  # title
             properties = set()
-            for n, row in enumerate(reader):
-                if n == 0:
-                    continue  # title
+            for row in reader:
                 name = row[0].strip()
                 # ver = row[1].strip()
                 cve = row[3].strip().lower()
@@ -1,7 +1,9 @@
+import pytest
+
 from tcsfw.address import IPAddress
 from tcsfw.verdict import Verdict
 from tcsfw.builder_backend import SystemBackend
-from tcsfw.main import UDP, HTTP
+from tcsfw.main import UDP, HTTP, ConfigurationException
 from tcsfw.basics import Status
 
 
@@ -39,3 +41,28 @@ def test_hosts():
 def test_address():
     assert not IPAddress.new("1.0.0.1").is_multicast()
 
+
+def test_protocol_backend_cache():
+    sb = SystemBackend()
+    http = HTTP(port=8080)
+    be = sb.get_protocol_backend(http)
+    assert sb.get_protocol_backend(HTTP(port=8080)) is be
+    assert sb.get_protocol_backend(HTTP(port=8081)) is not be
+    http.redirect()  # changed after use, still the same backend
+    assert sb.get_protocol_backend(http) is be
+
+
+def test_duplicate_address():
+    sb = SystemBackend()
+    dev1 = sb.device("Device 1").ip("192.168.0.1").dns("dev1.local")
+    dev2 = sb.device("Device 2")
+    # same node
+    with pytest.raises(ConfigurationException):
+        dev1.ip("192.168.0.1")
+    with pytest.raises(ConfigurationException):
+        dev1.dns("dev1.local")
+    # other node
+    with pytest.raises(ConfigurationException):
+        dev2.ip("192.168.0.1")
+    with pytest.raises(ConfigurationException):
+        dev2.dns("dev1.local")
@@ -3,6 +3,7 @@ from tcsfw.address import HWAddress, IPAddress
 from tcsfw.basics import ExternalActivity
 from tcsfw.builder_backend import SystemBackend
 from tcsfw.event_interface import PropertyEvent
+from tcsfw.entity_database import InMemoryDatabase
 from tcsfw.model import EvidenceNetworkSource
 from tcsfw.property import Properties
 from tcsfw.registry import Registry, Inspector
@@ -87,3 +88,26 @@ def test_db_source_storage():
         assert dev1.entity.connections == []
         reg.finish_model_load()
         assert dev1.entity.connections[0].source == dev1.entity  # thanks to address mapping
+
+
+def test_in_memory_pending_filter():
+    """Test fetching pending events from in-memory database with source filter"""
+    sb = SystemBackend()
+    dev1 = sb.device()
+    db = InMemoryDatabase()
+    src_a, src_b = EvidenceSource("Source A", label="a"), EvidenceSource("Source B", label="b")
+    events = []
+    for i in range(6):
+        e = PropertyEvent(Evidence(src_a if i % 3 else src_b), dev1.entity, Properties.MITM.verdict())
+        db.put_event(e)
+        events.append(e)
+    assert db.next_pending() is None
+
+    db.reset({"a": True})
+    assert [db.next_pending() for _ in range(5)] == [events[1], events[2], events[4], events[5], None]
+
+    db.reset({"b": True})
+    assert [db.next_pending() for _ in range(3)] == [events[0], events[3], None]
+
+    db.reset({"a": True, "b": True})
+    assert [db.next_pending() for _ in range(7)] == events + [None]
@@ -5,7 +5,9 @@ from test_model import simple_setup_1
 from tcsfw.inspector import Inspector
 from tcsfw.main import DHCP
 from tcsfw.registry import Registry
-from tcsfw.traffic import IPFlow, NO_EVIDENCE
+from tcsfw.event_interface import PropertyEvent
+from tcsfw.property import PropertyKey
+from tcsfw.traffic import Evidence, EvidenceSource, IPFlow, NO_EVIDENCE
 from tcsfw.basics import Status
 
 
@@ -139,3 +141,48 @@ def test_reset_dhcp():
     assert len(cli.connections) == 1
     assert cli.children[0].status == Status.EXPECTED
     assert cli.children[0].get_expected_verdict() == Verdict.PASS
+
+
+def test_property_sources():
+    sb = SystemBackend()
+    dev1 = sb.device("Device 1").entity
+    r = Registry(Inspector(sb.system))
+
+    src_a = EvidenceSource("Source A")
+    src_b = EvidenceSource("Source B")
+    key_1 = PropertyKey("prop-1")
+    key_2 = PropertyKey("prop-2")
+    r.property_update(PropertyEvent(Evidence(src_a), dev1, key_1.verdict(Verdict.PASS)))
+    r.property_update(PropertyEvent(Evidence(src_a), dev1, key_2.verdict(Verdict.PASS)))
+    r.property_update(PropertyEvent(Evidence(src_b), dev1, key_2.verdict(Verdict.FAIL)))
+
+    ps = r.logging.get_property_sources(dev1, {key_1, key_2, PropertyKey("prop-3")})
+    assert ps == {key_1: src_a, key_2: src_b}
+
+    r.reset().apply_all_events()
+    assert r.logging.get_property_sources(dev1, {key_1, key_2}) == {}
+
+    r.reset(enable_all=True).apply_all_events()
+    ps = r.logging.get_property_sources(dev1, {key_1, key_2})
+    assert ps == {key_1: src_a, key_2: src_b}
+
+
+def test_get_log():
+    sb = SystemBackend()
+    dev1 = sb.device("Device 1").entity
+    dev2 = sb.device("Device 2").entity
+    r = Registry(Inspector(sb.system))
+
+    evi = Evidence(EvidenceSource("Source A"))
+    key_1 = PropertyKey("prop-1")
+    key_2 = PropertyKey("prop-2")
+    r.property_update(PropertyEvent(evi, dev1, key_1.verdict(Verdict.PASS)))
+    r.property_update(PropertyEvent(evi, dev1, key_2.verdict(Verdict.PASS)))
+    r.property_update(PropertyEvent(evi, dev2, key_1.verdict(Verdict.FAIL)))
+
+    assert len(r.logging.get_log()) == 6
+    assert len(r.logging.get_log(dev1)) == 4
+    assert all(lo.entity == dev1 for lo in r.logging.get_log(dev1))
+    assert len(r.logging.get_log(key=key_1)) == 4
+    assert len(r.logging.get_log(dev2, key_1)) == 2
+    assert r.logging.get_log(dev2, key_2) == []
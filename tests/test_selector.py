@@ -67,3 +67,14 @@ def test_select_data():
 
     h = list(Select.data().personal().select(sb.system, ctx))
     assert len(h) == 2
+
+
+def test_select_sequence():
+    sb = simple_setup_1()
+    ctx = SelectorContext()
+    s = list((Select.host() / Select.service()).select(sb.system, ctx))
+    assert len(s) == 1
+
+    seq = Select.system() / (Select.host() / Select.service())
+    assert seq.pre == [Select.system(), Select.host()]
+    assert list(seq.select(sb.system, ctx)) == s